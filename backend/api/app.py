@@ -1,38 +1,249 @@
-from flask import Flask, request, jsonify, send_file
+import os
+
+# Let XLA auto-cluster CPU ops and enable oneDNN kernels; must be set before TensorFlow is imported
+os.environ.setdefault('TF_XLA_FLAGS', '--tf_xla_cpu_global_jit')
+os.environ.setdefault('TF_ENABLE_ONEDNN_OPTS', '1')
+
+from flask import Flask, Request, request, jsonify, send_file
 from flask_cors import CORS
 import tensorflow as tf
 import numpy as np
 import cv2
-import os
 import io
 import base64
+import hashlib
+import queue
+import threading
+import time
+from collections import OrderedDict
 from PIL import Image
+from preprocessing import resize_interpolation
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.patches import Polygon
 import warnings
 warnings.filterwarnings('ignore')
 
+# libjpeg-turbo decoding is optional; cv2.imdecode is used when it is unavailable
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    turbo_jpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    turbo_jpeg = None
+
+# numexpr is optional; plain NumPy comparison is used when it is unavailable
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+
+# One op uses every core; only a couple of independent ops run at once, so the
+# gunicorn threads don't oversubscribe the CPU (must run before the model loads)
+tf.config.threading.set_intra_op_parallelism_threads(os.cpu_count())
+tf.config.threading.set_inter_op_parallelism_threads(2)
 
 # Set matplotlib to use non-interactive backend
 plt.switch_backend('Agg')
 
+class InMemoryUploadRequest(Request):
+    """Request that keeps uploads in memory instead of spooling large ones to a temp file"""
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # Uploads are capped by MAX_CONTENT_LENGTH, so buffering them in memory is bounded
+        return io.BytesIO()
+
 app = Flask(__name__)
+app.request_class = InMemoryUploadRequest
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+
+# Optional path to a TFLite GPU delegate library (e.g. libtensorflowlite_gpu_delegate.so)
+TFLITE_GPU_DELEGATE = os.environ.get('TFLITE_GPU_DELEGATE')
+
+JPEG_QUALITY = 85 # Quality of the returned highlighted image
+
+# Highlight blending constants, built once instead of per request
+HIGHLIGHT_COLOR = np.array([0, 255, 255], dtype=np.float32)  # Yellow (BGR)
+HIGHLIGHT_ALPHA = 0.4  # Transparency factor
+HIGHLIGHT_BLEND = HIGHLIGHT_COLOR * HIGHLIGHT_ALPHA
+HIGHLIGHT_KEEP = np.float32(1 - HIGHLIGHT_ALPHA)  # float32 scalar keeps the blend out of float64
+
+RESULT_CACHE_SIZE = 256 # Number of recent detection results kept for repeated uploads
+# Total size of cached highlighted JPEGs, since each entry can be several MB
+RESULT_CACHE_MAX_BYTES = int(os.environ.get('RESULT_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+
+CORS(app, origins=["https://third-eye-xi.vercel.app"],
+     expose_headers=['X-Text-Regions-Detected', 'X-Confidence-Threshold'])# Enable CORS for all routes
+
+
+
+def padded_batch_sizes(max_batch_size):
+    """Batch sizes the model is run at: powers of two below max_batch_size, plus max_batch_size"""
+    sizes = []
+    size = 1
+    while size < max_batch_size:
+        sizes.append(size)
+        size *= 2
+    sizes.append(max_batch_size)
+    return sizes
+
+
+class BatchScheduler:
+    """
+    Merges concurrent inference requests into a single batched model call
+    """
+    def __init__(self, infer_fn, input_shape, max_batch_size=8, batch_timeout_micros=20000, warm_up=False):
+        self.infer_fn = infer_fn
+        self.max_batch_size = max_batch_size
+        self.batch_timeout = batch_timeout_micros / 1e6
+        
+        # Partial batches are padded up to one of a few sizes, so the model only
+        # ever sees those shapes (fewer XLA compiles and TFLite interpreters)
+        self.batch_sizes = padded_batch_sizes(max_batch_size)
+        
+        # Batches are assembled in place; only the worker thread touches this buffer
+        self._batch_buffer = np.zeros((max_batch_size, *input_shape), dtype=np.float32)
+        
+        # Batch sizes above 1 are warmed up by the worker while it is idle, so startup stays short
+        self._pending_warm_up = list(self.batch_sizes[1:]) if warm_up else []
+        
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name='batch-scheduler', daemon=True)
+        self._worker.start()
+    
+    def submit(self, image):
+        """Queue a preprocessed image and block until its predictions are ready"""
+        # The model is specialized to one input shape; reject mismatches before they can fail a whole batch
+        if image.shape != self._batch_buffer.shape[1:] or image.dtype != np.float32:
+            raise ValueError(
+                f"Expected a float32 image of shape {self._batch_buffer.shape[1:]}, "
+                f"got {image.dtype} {image.shape}"
+            )
+        
+        request_item = {'image': image, 'done': threading.Event()}
+        self._queue.put(request_item)
+        request_item['done'].wait()
+        
+        if 'error' in request_item:
+            raise request_item['error']
+        return request_item['score_map'], request_item['geometry_map']
+    
+    def _collect_batch(self):
+        """Wait for one request, then gather more until the batch is full or the timeout expires"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.batch_timeout
+        
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        
+        return batch
+    
+    def _warm_up(self, batch_size):
+        """Run one dummy batch so compilation/setup for this size happens before traffic needs it"""
+        try:
+            self.infer_fn(self._batch_buffer[:batch_size])
+        except Exception as e:
+            print(f"Warning: Warm-up for batch size {batch_size} failed: {str(e)}")
+    
+    def _run(self):
+        """Worker loop: run one model call per collected batch and hand results back"""
+        while True:
+            if self._pending_warm_up and self._queue.empty():
+                self._warm_up(self._pending_warm_up.pop(0))
+                continue
+            
+            batch = self._collect_batch()
+            try:
+                # Rows past len(batch) hold stale images; their outputs are never read
+                padded_size = next(size for size in self.batch_sizes if size >= len(batch))
+                np.stack([item['image'] for item in batch], out=self._batch_buffer[:len(batch)])
+                score_maps, geometry_maps = self.infer_fn(self._batch_buffer[:padded_size])
+                for i, item in enumerate(batch):
+                    item['score_map'] = score_maps[i]
+                    item['geometry_map'] = geometry_maps[i]
+            except Exception as e:
+                for item in batch:
+                    item['error'] = e
+            finally:
+                for item in batch:
+                    item['done'].set()
 
-CORS(app, origins=["https://third-eye-xi.vercel.app"])# Enable CORS for all routes
 
+class ResultCache:
+    """
+    Thread-safe LRU cache of detection results keyed by image hash
+    """
+    def __init__(self, maxsize=256, max_bytes=256 * 1024 * 1024):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._results = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the cached result for key (marking it recently used), or None"""
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+            return result
+    
+    def put(self, key, result):
+        """Store a result, evicting the least recently used entries beyond maxsize or max_bytes"""
+        size = len(result['highlighted_jpeg'])
+        if size > self.max_bytes:
+            return
+        
+        with self._lock:
+            previous = self._results.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= len(previous['highlighted_jpeg'])
+            
+            self._results[key] = result
+            self._total_bytes += size
+            while len(self._results) > self.maxsize or self._total_bytes > self.max_bytes:
+                _, evicted = self._results.popitem(last=False)
+                self._total_bytes -= len(evicted['highlighted_jpeg'])
 
 
 class TextDetectionInference:
     """
     Inference class for trained text detection model
     """
-    def __init__(self, model_path, input_size=(512, 512)):
+    def __init__(self, model_path, input_size=(512, 512), max_batch_size=8, batch_timeout_micros=20000):
         self.input_size = input_size
         self.output_size = (input_size[0]//4, input_size[1]//4)  # Due to stride 4
+        self.max_batch_size = max_batch_size
         
-        # Load the trained model
+        # Scratch buffers for preprocessing, one set per request thread
+        self._buffers = threading.local()
+        
+        # Load the trained model (quantized TFLite if available, else Keras)
         print(f"Loading model from {model_path}...")
+        if model_path.endswith('.tflite'):
+            self._load_tflite_model(model_path)
+        else:
+            self._load_keras_model(model_path)
+        print("Model loaded successfully!")
+        
+        # Run a dummy forward pass so kernel setup and tracing don't land on the first request;
+        # the larger padded batch sizes are warmed up by the scheduler in the background
+        input_w, input_h = self.input_size
+        self._infer(np.zeros((1, input_h, input_w, 3), dtype=np.float32))
+        print("Model warmed up!")
+        
+        # Requests arriving close together share a single forward pass
+        self.batch_scheduler = BatchScheduler(
+            self._infer, (input_h, input_w, 3), self.max_batch_size, batch_timeout_micros, warm_up=True
+        )
+    
+    def _load_keras_model(self, model_path):
+        """Load the original Keras .h5 model"""
         self.model = tf.keras.models.load_model(
             model_path,
             custom_objects={
@@ -40,7 +251,94 @@ class TextDetectionInference:
                 'geometry_loss': self.geometry_loss
             }
         )
-        print("Model loaded successfully!")
+        
+        # Trace the forward pass once so requests skip Keras predict() dispatch,
+        # and compile it with XLA so conv/bias/activation ops get fused. The spatial
+        # shape is fixed to the input size (only the batch dimension varies), so
+        # callers must pass (N, input_h, input_w, 3) float32 batches.
+        input_w, input_h = self.input_size
+        self._keras_infer = tf.function(
+            lambda x: self.model(x, training=False),
+            input_signature=[tf.TensorSpec([None, input_h, input_w, 3], tf.float32)],
+            jit_compile=True
+        ).get_concrete_function()
+        self._infer = self._infer_keras
+    
+    def _load_tflite_model(self, model_path):
+        """Load a TFLite model produced by convert_to_tflite.py"""
+        self._tflite_model_path = model_path
+        self._tflite_delegates = []
+        if TFLITE_GPU_DELEGATE:
+            # FP16 models run natively on the GPU delegate
+            try:
+                self._tflite_delegates.append(tf.lite.experimental.load_delegate(TFLITE_GPU_DELEGATE))
+                print(f"Using TFLite GPU delegate: {TFLITE_GPU_DELEGATE}")
+            except Exception as e:
+                print(f"Warning: Could not load GPU delegate, falling back to CPU: {str(e)}")
+        
+        if self._tflite_delegates:
+            # A delegated graph can't be resized safely, so the GPU path runs unbatched
+            self.max_batch_size = 1
+        
+        # One interpreter per padded batch size, each sized before its first allocation
+        self._interpreters = {}
+        interpreter = self._get_interpreter(1)
+        self._input_details = interpreter.get_input_details()[0]
+        
+        # Output order is not guaranteed after conversion; the score map has a single channel
+        output_details = interpreter.get_output_details()
+        self._score_output = next(d for d in output_details if d['shape'][-1] == 1)
+        self._geometry_output = next(d for d in output_details if d['shape'][-1] != 1)
+        
+        if self._input_details['dtype'] == np.uint8:
+            # Quantization buffers, reused on every call (the model only runs on one thread at a time)
+            input_shape = self._input_details['shape'][1:]
+            self._quantize_scratch = np.empty((self.max_batch_size, *input_shape), dtype=np.float32)
+            self._quantized_batch = np.empty((self.max_batch_size, *input_shape), dtype=np.uint8)
+        self._infer = self._infer_tflite
+    
+    def _get_interpreter(self, batch_size):
+        """Return the interpreter for a padded batch size, building it on first use"""
+        interpreter = self._interpreters.get(batch_size)
+        if interpreter is None:
+            interpreter = tf.lite.Interpreter(
+                model_path=self._tflite_model_path,
+                num_threads=os.cpu_count(),
+                experimental_delegates=self._tflite_delegates
+            )
+            if batch_size != 1:
+                # Resize before allocate_tensors so XNNPACK plans and packs weights once
+                input_details = interpreter.get_input_details()[0]
+                interpreter.resize_tensor_input(
+                    input_details['index'], [batch_size, *input_details['shape'][1:]]
+                )
+            interpreter.allocate_tensors()
+            self._interpreters[batch_size] = interpreter
+        return interpreter
+    
+    def _infer_keras(self, image_batch):
+        """Run the Keras model on a float32 batch"""
+        predictions = self._keras_infer(tf.constant(image_batch))
+        return predictions[0].numpy(), predictions[1].numpy()
+    
+    def _infer_tflite(self, image_batch):
+        """Run the TFLite interpreter on a float32 batch"""
+        if self._input_details['dtype'] == np.uint8:
+            # Quantize the [0, 1] input with the calibrated scale and zero point, in place
+            scale, zero_point = self._input_details['quantization']
+            scratch = self._quantize_scratch[:len(image_batch)]
+            np.divide(image_batch, np.float32(scale), out=scratch)
+            np.add(scratch, np.float32(zero_point), out=scratch)
+            np.rint(scratch, out=scratch)
+            np.clip(scratch, 0, 255, out=scratch)
+            image_batch = self._quantized_batch[:len(image_batch)]
+            np.copyto(image_batch, scratch, casting='unsafe')
+        
+        interpreter = self._get_interpreter(len(image_batch))
+        interpreter.set_tensor(self._input_details['index'], image_batch)
+        interpreter.invoke()
+        return (interpreter.get_tensor(self._score_output['index']),
+                interpreter.get_tensor(self._geometry_output['index']))
     
     def dice_loss(self, y_true, y_pred):
         """Dice loss function (needed for loading model)"""
@@ -54,14 +352,29 @@ class TextDetectionInference:
         """Geometry loss function (needed for loading model)"""
         return tf.keras.losses.huber(y_true, y_pred)
     
+    def _get_buffers(self):
+        """Return this thread's resize and normalization buffers, allocating them once"""
+        buffers = self._buffers
+        if not hasattr(buffers, 'resized'):
+            input_w, input_h = self.input_size
+            buffers.resized = np.empty((input_h, input_w, 3), dtype=np.uint8)
+            buffers.normalized = np.empty((input_h, input_w, 3), dtype=np.float32)
+        return buffers.resized, buffers.normalized
+    
     def preprocess_image(self, image):
-        """Preprocess image for inference"""
+        """Preprocess a BGR image for inference (the model is fed BGR, no channel flip)"""
         # Store original dimensions
         orig_h, orig_w = image.shape[:2]
         
-        # Resize image
-        resized_image = cv2.resize(image, self.input_size)
-        normalized_image = resized_image.astype(np.float32) / 255.0
+        # Resize and normalize into reused buffers instead of fresh allocations
+        resized_image, normalized_image = self._get_buffers()
+        if (orig_w, orig_h) == self.input_size:
+            # Already the model input size, skip resampling
+            resized_image = image
+        else:
+            interpolation = resize_interpolation(orig_w, orig_h, self.input_size)
+            cv2.resize(image, self.input_size, dst=resized_image, interpolation=interpolation)
+        np.divide(resized_image, np.float32(255.0), out=normalized_image)
         
         return normalized_image, (orig_h, orig_w)
     
@@ -69,17 +382,14 @@ class TextDetectionInference:
         """Make prediction on image"""
         # Preprocess
         processed_image, orig_size = self.preprocess_image(image_input)
-        image_batch = np.expand_dims(processed_image, axis=0)
         
-        # Predict
-        predictions = self.model.predict(image_batch, verbose=0)
-        score_map = predictions[0][0]  # Remove batch dimension
-        geometry_map = predictions[1][0]  # Remove batch dimension
+        # Predict (batched with other in-flight requests)
+        score_map, geometry_map = self.batch_scheduler.submit(processed_image)
         
         return score_map, geometry_map, processed_image, orig_size
     
     def process_image_and_return_highlighted(self, image, threshold=0.5):
-        """Process image and return highlighted image as base64"""
+        """Process a BGR image and return highlighted image as JPEG bytes"""
         try:
             # Get predictions
             score_map, geometry_map, processed_image, orig_size = self.predict(image, threshold)
@@ -87,40 +397,32 @@ class TextDetectionInference:
             # Create highlighted image
             highlighted_image = image.copy()
             
-            # Resize binary score map to original image dimensions
-            binary_score = (score_map[:, :, 0] > threshold).astype(np.uint8)
-            binary_score_resized = cv2.resize(binary_score, (orig_size[1], orig_size[0]), interpolation=cv2.INTER_NEAREST)
-            
-            # Create a colored overlay from the resized binary score map
-            highlight_color = np.array([255, 255, 0], dtype=np.uint8)  # Yellow
-            overlay = np.zeros_like(image, dtype=np.uint8)
-            overlay[binary_score_resized == 1] = highlight_color
-            
-            # Blend the overlay with the original image
-            alpha = 0.4  # Transparency factor
-            cv2.addWeighted(overlay, alpha, highlighted_image, 1 - alpha, 0, highlighted_image)
-            
-            # Convert BGR to RGB for proper display
-            highlighted_image_rgb = cv2.cvtColor(highlighted_image, cv2.COLOR_BGR2RGB)
-            
-            # Convert to PIL Image
-            pil_image = Image.fromarray(highlighted_image_rgb)
+            # Resize the score map to original image dimensions, then threshold it
+            score_map_resized = cv2.resize(score_map[:, :, 0], (orig_size[1], orig_size[0]), interpolation=cv2.INTER_LINEAR)
+            if ne is not None:
+                # Multi-threaded single-pass compare; the map is at full photo resolution
+                mask = ne.evaluate('s > t', local_dict={'s': score_map_resized, 't': np.float32(threshold)})
+            else:
+                mask = score_map_resized > threshold
             
-            # Convert to base64
-            buffer = io.BytesIO()
-            pil_image.save(buffer, format='PNG')
-            buffer.seek(0)
+            # Blend the highlight color into the detected pixels only
+            # (pixels outside text regions are left at full brightness)
+            text_pixels = highlighted_image[mask] * HIGHLIGHT_KEEP
+            text_pixels += HIGHLIGHT_BLEND
+            highlighted_image[mask] = np.rint(text_pixels, out=text_pixels).astype(np.uint8)
             
-            # Encode to base64
-            img_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
+            # Encode as JPEG (cv2 expects BGR, so no color conversion is needed)
+            ok, buffer = cv2.imencode('.jpg', highlighted_image, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+            if not ok:
+                raise ValueError('Could not encode highlighted image')
             
             # Count detected text regions
-            text_regions_count = np.sum(binary_score_resized == 1)
+            text_regions_count = int(np.count_nonzero(mask))
             
             return {
                 'success': True,
-                'highlighted_image': f'data:image/png;base64,{img_base64}',
-                'text_regions_detected': int(text_regions_count),
+                'highlighted_jpeg': buffer.tobytes(),
+                'text_regions_detected': text_regions_count,
                 'confidence_threshold': threshold
             }
             
@@ -131,9 +433,59 @@ class TextDetectionInference:
                 'error': str(e)
             }
 
+def decode_image(stream):
+    """Decode an in-memory (BytesIO) upload to a BGR array, or None if decoding fails"""
+    with stream.getbuffer() as file_bytes:
+        if turbo_jpeg is not None and file_bytes[:2] == b'\xff\xd8':
+            try:
+                # turbojpeg ignores EXIF orientation, so only use it for upright images.
+                # PIL parses just the header straight from the stream, without copying it.
+                stream.seek(0)
+                orientation = Image.open(stream).getexif().get(0x0112, 1)
+                if orientation == 1:
+                    return turbo_jpeg.decode(file_bytes, pixel_format=TJPF_BGR)
+            except Exception as e:
+                print(f"Warning: turbojpeg decode failed, falling back to OpenCV: {str(e)}")
+        
+        nparr = np.frombuffer(file_bytes, np.uint8)
+        try:
+            return cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        except cv2.error:
+            return None
+        finally:
+            # Drop the numpy view so the memoryview can be released on exit
+            del nparr
+
+def detection_response(result):
+    """Build the /detect-text response: raw JPEG with metadata headers if requested, else JSON"""
+    if not result['success']:
+        return jsonify(result)
+    
+    # Clients that ask for image/jpeg get the bytes directly, skipping base64 and JSON encoding
+    if request.accept_mimetypes.best_match(['application/json', 'image/jpeg']) == 'image/jpeg':
+        response = send_file(io.BytesIO(result['highlighted_jpeg']), mimetype='image/jpeg')
+        response.headers['X-Text-Regions-Detected'] = str(result['text_regions_detected'])
+        response.headers['X-Confidence-Threshold'] = str(result['confidence_threshold'])
+    else:
+        img_base64 = base64.b64encode(result['highlighted_jpeg']).decode('utf-8')
+        response = jsonify({
+            'success': True,
+            'highlighted_image': f'data:image/jpeg;base64,{img_base64}',
+            'text_regions_detected': result['text_regions_detected'],
+            'confidence_threshold': result['confidence_threshold']
+        })
+    
+    # The body format depends on Accept, so caches must not share responses across it
+    response.vary.add('Accept')
+    return response
+
 # Initialize the detector (you'll need to update the model path)
 MODEL_PATH = 'best_text_detector.h5' # Update this path
+TFLITE_MODEL_PATH = 'best_text_detector.tflite' # Produced by convert_to_tflite.py
+if os.path.exists(TFLITE_MODEL_PATH):
+    MODEL_PATH = TFLITE_MODEL_PATH
 detector = None
+result_cache = ResultCache(RESULT_CACHE_SIZE, RESULT_CACHE_MAX_BYTES)
 
 try:
     if os.path.exists(MODEL_PATH):
@@ -186,10 +538,18 @@ def detect_text():
                 'error': 'Only image files are supported'
             }), 400
         
-        # Read and convert image
-        file_bytes = file.read()
-        nparr = np.frombuffer(file_bytes, np.uint8)
-        image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        # Fixed threshold of 0.5
+        threshold = 0.5
+        
+        # Retries and re-submissions of the same image reuse the earlier result
+        with file.stream.getbuffer() as file_bytes:
+            cache_key = (hashlib.blake2b(file_bytes, digest_size=16).digest(), threshold)
+        cached_result = result_cache.get(cache_key)
+        if cached_result is not None:
+            return detection_response(cached_result)
+        
+        # Read and convert image straight from the in-memory upload buffer (no copy)
+        image = decode_image(file.stream)
         
         if image is None:
             return jsonify({
@@ -197,10 +557,12 @@ def detect_text():
                 'error': 'Could not decode image'
             }), 400
         
-        # Process image with fixed threshold of 0.5
-        result = detector.process_image_and_return_highlighted(image, threshold=0.5)
+        # Process image
+        result = detector.process_image_and_return_highlighted(image, threshold=threshold)
+        if result['success']:
+            result_cache.put(cache_key, result)
         
-        return jsonify(result)
+        return detection_response(result)
         
     except Exception as e:
         print(f"Error in detect_text endpoint: {str(e)}")
@@ -257,10 +619,10 @@ if __name__ == '__main__':
         print("  - POST /detect-text : Process image for text detection")
         print("  - GET  /model-info  : Get model information")
         
-        # Configure Flask app
-        app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
-        
-        # Start the server
+        # Start the server (serve with gunicorn in production; the model and
+        # batch scheduler are shared by threads of a single worker process)
+        print("\n💡 For production run: gunicorn app:app -w 1 --threads 8 -k gthread -b 0.0.0.0:5000 --timeout 120")
+        app.run(host='0.0.0.0', port=5000, threaded=True)
 
     else:
         print("❌ Failed to load model. Please check:")
@@ -0,0 +1,9 @@
+import cv2
+
+
+def resize_interpolation(orig_w, orig_h, input_size):
+    """Pick the resize interpolation used to bring an image to the model input size"""
+    # INTER_AREA is both faster and sharper when shrinking
+    if orig_w > input_size[0] or orig_h > input_size[1]:
+        return cv2.INTER_AREA
+    return cv2.INTER_LINEAR
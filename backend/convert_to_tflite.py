@@ -0,0 +1,99 @@
+"""
+Offline conversion of the Keras text detector to a quantized TFLite model.
+
+Usage:
+    python convert_to_tflite.py --calibration-dir path/to/sample/images
+    python convert_to_tflite.py --quantization fp16
+
+The resulting .tflite file is picked up automatically by api/app.py when it
+sits next to the original .h5 model.
+"""
+import argparse
+import glob
+import os
+import sys
+
+import cv2
+import numpy as np
+import tensorflow as tf
+
+MODEL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'api')
+sys.path.insert(0, MODEL_DIR)
+from preprocessing import resize_interpolation
+INPUT_SIZE = (512, 512)
+IMAGE_EXTENSIONS = ('*.jpg', '*.jpeg', '*.png', '*.bmp')
+
+
+def representative_dataset(calibration_dir, num_samples):
+    """Yield preprocessed sample images for INT8 calibration"""
+    paths = []
+    for pattern in IMAGE_EXTENSIONS:
+        paths.extend(glob.glob(os.path.join(calibration_dir, pattern)))
+    paths = sorted(paths)[:num_samples]
+    if not paths:
+        raise ValueError(f"No calibration images found in {calibration_dir}")
+
+    def gen():
+        for path in paths:
+            image = cv2.imread(path, cv2.IMREAD_COLOR)
+            if image is None:
+                continue
+            # Same preprocessing as TextDetectionInference.preprocess_image
+            orig_h, orig_w = image.shape[:2]
+            interpolation = resize_interpolation(orig_w, orig_h, INPUT_SIZE)
+            resized_image = cv2.resize(image, INPUT_SIZE, interpolation=interpolation)
+            normalized_image = resized_image.astype(np.float32) / 255.0
+            yield [np.expand_dims(normalized_image, axis=0)]
+
+    return gen
+
+
+def convert_int8(model, calibration_dir, num_samples):
+    """Fully quantize weights and activations to INT8"""
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = representative_dataset(calibration_dir, num_samples)
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.uint8
+    # Keep outputs float so the score map threshold stays in [0, 1]
+    converter.inference_output_type = tf.float32
+    return converter.convert()
+
+
+def convert_fp16(model):
+    """Store weights as float16; no calibration data needed"""
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.target_spec.supported_types = [tf.float16]
+    return converter.convert()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert the text detector to TFLite')
+    parser.add_argument('--model', default=os.path.join(MODEL_DIR, 'best_text_detector.h5'))
+    parser.add_argument('--output', default=os.path.join(MODEL_DIR, 'best_text_detector.tflite'))
+    parser.add_argument('--quantization', choices=['int8', 'fp16'], default='int8')
+    parser.add_argument('--calibration-dir',
+                        help='Directory of sample images used for INT8 calibration')
+    parser.add_argument('--num-samples', type=int, default=100)
+    args = parser.parse_args()
+
+    if args.quantization == 'int8' and not args.calibration_dir:
+        parser.error('--calibration-dir is required for int8 quantization')
+
+    print(f"Loading model from {args.model}...")
+    # The training losses are not needed for conversion
+    model = tf.keras.models.load_model(args.model, compile=False)
+
+    if args.quantization == 'int8':
+        tflite_model = convert_int8(model, args.calibration_dir, args.num_samples)
+    else:
+        tflite_model = convert_fp16(model)
+
+    with open(args.output, 'wb') as f:
+        f.write(tflite_model)
+    print(f"Saved TFLite model to {args.output} ({len(tflite_model) / 1024 / 1024:.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
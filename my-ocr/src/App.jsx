@@ -3,7 +3,7 @@ import React, { useState, useEffect } from 'react';
 // Main App component
 function App() {
   const [selectedImage, setSelectedImage] = useState(null); // The original image file
-  const [highlightedImageSrc, setHighlightedImageSrc] = useState(null); // Base64 for the processed image
+  const [highlightedImageSrc, setHighlightedImageSrc] = useState(null); // Object URL for the processed image
   const [textRegionsDetected, setTextRegionsDetected] = useState(0); // Count from backend
   const [isDragOver, setIsDragOver] = useState(false);
   const [isProcessing, setIsProcessing] = useState(false);
@@ -17,6 +17,15 @@ function App() {
   // Define your backend API URL
   const API_BASE_URL = 'https://ocr-production-0ada.up.railway.app'; // Make sure this matches your Flask backend URL
 
+  // Release the previous processed image blob when it is replaced or cleared
+  useEffect(() => {
+    return () => {
+      if (highlightedImageSrc && highlightedImageSrc.startsWith('blob:')) {
+        URL.revokeObjectURL(highlightedImageSrc);
+      }
+    };
+  }, [highlightedImageSrc]);
+
   // Function to show custom message box
   const showCustomMessageBox = (message) => {
     setMessageBox({ visible: true, content: message });
@@ -87,6 +96,8 @@ function App() {
     try {
       const response = await fetch(`${API_BASE_URL}/detect-text`, {
         method: 'POST',
+        // Ask for the raw JPEG (metadata comes back in headers) instead of base64 JSON
+        headers: { Accept: 'image/jpeg' },
         body: formData,
       });
 
@@ -102,6 +113,18 @@ function App() {
         throw new Error(errorData.error || `HTTP error! status: ${response.status}`);
       }
 
+      const contentType = response.headers.get('Content-Type') || '';
+      if (contentType.startsWith('image/')) {
+        const imageBlob = await response.blob();
+        console.log('Backend response: image', imageBlob.size, 'bytes');
+
+        setHighlightedImageSrc(URL.createObjectURL(imageBlob));
+        setTextRegionsDetected(parseInt(response.headers.get('X-Text-Regions-Detected'), 10) || 0);
+        showCustomMessageBox('🎉 Text detection complete!');
+        setShowResultPage(true);
+        return;
+      }
+
       const result = await response.json();
       console.log('Backend response:', result);
 